@@ -1,16 +1,32 @@
 import argparse
 import http.server
-import json
+import itertools
 import logging
 import os
+import queue
+import selectors
+import socket
 import socketserver
+import threading
 import time
-import uuid
-from typing import Any, Optional, Tuple
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Iterator, Optional, Tuple
 
+import httpx
+import orjson
 from dotenv import find_dotenv, load_dotenv
 from gigachat import GigaChat
-from gigachat.models import Chat, ChatCompletion
+from gigachat.models import ChatCompletion, ChatCompletionChunk
+
+try:
+    # Private SDK helper, used to size the client's connection pool; a gigachat release may drop it.
+    from gigachat.client import _get_kwargs
+except ImportError:
+    _get_kwargs = None
+
+logger = logging.getLogger(__name__)
+# Per-request access log lines, which BaseHTTPRequestHandler would otherwise write straight to stderr.
+access_logger = logging.getLogger(f"{__name__}.access")
 
 # Load environment variables
 env_path = find_dotenv(".env")
@@ -23,36 +39,106 @@ def init_gigachat_client() -> GigaChat:
     """
     verify_ssl_certs = os.getenv("GIGACHAT_VERIFY_SSL_CERTS", "False") != "False"
     profanity_check = os.getenv("GIGACHAT_PROFANITY_CHECK", "False") != "False"
-    return GigaChat(verify_ssl_certs=verify_ssl_certs, profanity_check=profanity_check, timeout=600)
+    client = GigaChat(verify_ssl_certs=verify_ssl_certs, profanity_check=profanity_check, timeout=600)
+    # The SDK lazily builds its httpx client with default pool limits, which only keep 20 connections
+    # alive. Give it a pool sized for concurrent handler threads so they don't re-handshake with GigaChat.
+    try:
+        client._client = httpx.Client(
+            **_get_kwargs(client._settings),
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=128, keepalive_expiry=60),
+        )
+    except (AttributeError, TypeError) as e:
+        logger.warning("Could not size the GigaChat connection pool, using the SDK's default: %s", e)
+    return client
 
 giga = init_gigachat_client()
 
-def remove_none(obj: Any) -> Any:
+def load_models_response() -> Optional[bytes]:
+    """
+    Reads models.json once and serializes it for the /models endpoint.
+
+    Returns:
+        The response body, or None if models.json is missing.
     """
-    Recursively removes None values from dictionaries and lists.
+    try:
+        with open("models.json", "rb") as f:
+            return orjson.dumps(orjson.loads(f.read()))
+    except FileNotFoundError:
+        return None
+
+models_response = load_models_response()
+
+# Pre-encoded equivalent of ProxyHandler._send_CORS_headers.
+CORS_HEADERS = (
+    b"Access-Control-Allow-Origin: *\r\n"
+    b"Access-Control-Allow-Headers: Content-Type, Authorization\r\n"
+    b"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+)
+
+# Status line and headers that are the same on every JSON completion response, encoded once.
+# It ends with the Content-Length name; the handler appends the per-response values and the body.
+JSON_RESPONSE_HEAD = (
+    b"HTTP/1.1 200 OK\r\n"
+    + CORS_HEADERS
+    + b"Content-Type: application/json\r\n"
+    b"Access-Control-Expose-Headers: X-Request-ID\r\n"
+    b"OpenAI-Organization: user-1234567890\r\n"
+    b"OpenAI-Processing-Ms: 100\r\n"
+    b"OpenAI-Version: 2020-10-01\r\n"
+    b"X-RateLimit-Limit-Requests: 10000\r\n"
+    b"X-RateLimit-Limit-Tokens: 50000000\r\n"
+    b"X-RateLimit-Remaining-Requests: 9999\r\n"
+    b"X-RateLimit-Remaining-Tokens: 49999945\r\n"
+    b"X-RateLimit-Reset-Requests: 6ms\r\n"
+    b"X-RateLimit-Reset-Tokens: 0s\r\n"
+    b"Content-Length: "
+)
+
+# Same for streamed completions; ends with the Date name. The event stream has no Content-Length,
+# so the handler adds the framing header: chunked transfer encoding, or closing the connection.
+EVENT_STREAM_RESPONSE_HEAD = (
+    b"HTTP/1.1 200 OK\r\n"
+    + CORS_HEADERS
+    + b"Content-Type: text/event-stream; charset=utf-8\r\n"
+    b"Cache-Control: no-cache\r\n"
+    b"X-Accel-Buffering: no\r\n"
+    b"Date: "
+)
+
+# Token usage details GigaChat doesn't report; shared by all responses, so they must not be mutated.
+PROMPT_TOKENS_DETAILS = {"cached_tokens": 0}
+COMPLETION_TOKENS_DETAILS = {"reasoning_tokens": 0}
+
+def to_function_content(content: Any) -> str:
+    """
+    Converts the content of a tool message to the JSON text GigaChat expects in function messages.
 
     Args:
-        obj: The object to clean.
+        content: The tool message content.
 
     Returns:
-        The cleaned object with None values removed.
+        The content itself if it is a JSON object, otherwise its JSON encoding.
     """
-    if isinstance(obj, dict):
-        return {k: remove_none(v) for k, v in obj.items() if v is not None}
-    elif isinstance(obj, list):
-        return [remove_none(v) for v in obj if v is not None]
-    else:
-        return obj
-
-def transform_input_data(data: dict) -> Tuple[Chat, Optional[str]]:
+    # Only objects are passed through, so e.g. "42" and "hello" are both sent as JSON strings.
+    if isinstance(content, str) and content.lstrip().startswith("{"):
+        try:
+            orjson.loads(content)
+            return content
+        except orjson.JSONDecodeError:
+            pass
+    return orjson.dumps(content).decode("utf-8")
+
+def transform_input_data(data: dict) -> Tuple[dict, Optional[str]]:
     """
     Transforms the input data from the client to the format expected by GigaChat API.
 
+    The result is left as a plain dict: GigaChat validates it into a Chat itself.
+
     Args:
         data: The input data dictionary.
 
     Returns:
-        A tuple containing the Chat object and the GPT model name.
+        A tuple containing the chat payload and the GPT model name.
     """
     gpt_model = data.pop("model", None)
     temperature = data.pop("temperature", None)
@@ -61,24 +147,31 @@ def transform_input_data(data: dict) -> Tuple[Chat, Optional[str]]:
     elif temperature and temperature > 0:
         data["temperature"] = temperature
 
-    if "functions" not in data and data.get("tools"):
-        data["functions"] = [
-            tool["function"] for tool in data.get("tools", []) if tool["type"] == "function"
-        ]
+    tools = data.get("tools")
+    if tools and "functions" not in data:
+        data["functions"] = [tool["function"] for tool in tools if tool["type"] == "function"]
 
+    messages = []
     for i, message in enumerate(data["messages"]):
         message.pop("name", None)
-        # No non-first system messages available.
-        if message["role"] == "system" and i > 0:
-            message["role"] = "user"
-        if message["role"] == "tool":
+        role = message["role"]
+        if role == "tool":
             message["role"] = "function"
-            message["content"] = json.dumps(message.get("content", ""), ensure_ascii=False)
-        if message["content"] is None:
+            message["content"] = to_function_content(message.get("content", ""))
+        elif message.get("content") is None:
             message["content"] = ""
+        # No non-first system messages available.
+        if role == "system" and i > 0:
+            message["role"] = "user"
+
+        # Collapse consecutive user role messages into one
+        if messages and message["role"] == "user" and messages[-1]["role"] == "user":
+            messages[-1]["content"] += "\n" + message["content"]
+        else:
+            messages.append(message)
+    data["messages"] = messages
 
-    chat = Chat.parse_obj(data)
-    return chat, gpt_model
+    return data, gpt_model
 
 def process_gigachat_response(giga_resp: ChatCompletion, gpt_model: str) -> dict:
     """
@@ -91,45 +184,87 @@ def process_gigachat_response(giga_resp: ChatCompletion, gpt_model: str) -> dict
     Returns:
         A dictionary formatted as the client's expected response.
     """
-    giga_dict = json.loads(giga_resp.json())
-    giga_dict = remove_none(giga_dict)
-
-    for choice in giga_dict["choices"]:
-        choice["index"] = 0
-        choice["logprobs"] = None
-        choice["message"]["refusal"] = None
-        if choice["message"]["role"] == "assistant":
-            if choice["message"].get("function_call"):
-                arguments = json.dumps(
-                    choice["message"]["function_call"]["arguments"],
-                    ensure_ascii=False,
-                )
-                choice["message"]["function_call"] = {
-                    "name": choice["message"]["function_call"]["name"],
-                    "arguments": arguments,
-                }
-                if choice["message"].get("content") == "":
-                    choice["message"]["content"] = None
-                choice["message"].pop("functions_state_id", None)
-                choice["message"]["refusal"] = None
+    choices = []
+    for giga_choice in giga_resp.choices:
+        giga_message = giga_choice.message
+        message = {"role": giga_message.role, "content": giga_message.content, "refusal": None}
+        if giga_message.function_call and giga_message.role == "assistant":
+            message["function_call"] = {
+                "name": giga_message.function_call.name,
+                "arguments": orjson.dumps(giga_message.function_call.arguments).decode("utf-8"),
+            }
+            if giga_message.content == "":
+                message["content"] = None
+        choices.append({
+            "index": 0,
+            "message": message,
+            "logprobs": None,
+            "finish_reason": giga_choice.finish_reason,
+        })
 
     result = {
-        "id": "chatcmpl-" + str(uuid.uuid4()),
+        "id": "chatcmpl-" + os.urandom(16).hex(),
         "object": "chat.completion",
-        "created": int(time.time() * 1000),
+        "created": giga_resp.created,
         "model": gpt_model,
-        "choices": giga_dict["choices"],
+        "choices": choices,
         "usage": {
-            "prompt_tokens": 10,
-            "completion_tokens": 10,
-            "total_tokens": 20,
-            "prompt_tokens_details": {"cached_tokens": 0},
-            "completion_tokens_details": {"reasoning_tokens": 0},
+            "prompt_tokens": giga_resp.usage.prompt_tokens,
+            "completion_tokens": giga_resp.usage.completion_tokens,
+            "total_tokens": giga_resp.usage.total_tokens,
+            "prompt_tokens_details": PROMPT_TOKENS_DETAILS,
+            "completion_tokens_details": COMPLETION_TOKENS_DETAILS,
         },
-        "system_fingerprint": f"fp_{uuid.uuid4()}",
+        "system_fingerprint": f"fp_{os.urandom(16).hex()}",
     }
     return result
 
+def process_gigachat_chunk(
+    giga_chunk: ChatCompletionChunk, gpt_model: str, response_id: str, system_fingerprint: str
+) -> dict:
+    """
+    Processes a streamed chunk from GigaChat API and transforms it to the format expected by the client.
+
+    Args:
+        giga_chunk: The response chunk from GigaChat API.
+        gpt_model: The GPT model name.
+        response_id: The completion id shared by all chunks of the response.
+        system_fingerprint: The fingerprint shared by all chunks of the response.
+
+    Returns:
+        A dictionary formatted as the client's expected response chunk.
+    """
+    choices = []
+    for giga_choice in giga_chunk.choices:
+        giga_delta = giga_choice.delta
+        delta = {}
+        if giga_delta.role is not None:
+            delta["role"] = giga_delta.role
+        if giga_delta.content is not None:
+            delta["content"] = giga_delta.content
+        if giga_delta.function_call:
+            delta["function_call"] = {
+                "name": giga_delta.function_call.name,
+                "arguments": orjson.dumps(giga_delta.function_call.arguments).decode("utf-8"),
+            }
+            if giga_delta.content == "":
+                delta["content"] = None
+        choices.append({
+            "index": giga_choice.index,
+            "delta": delta,
+            "logprobs": None,
+            "finish_reason": giga_choice.finish_reason,
+        })
+
+    return {
+        "id": response_id,
+        "object": "chat.completion.chunk",
+        "created": giga_chunk.created,
+        "model": gpt_model,
+        "system_fingerprint": system_fingerprint,
+        "choices": choices,
+    }
+
 def send_to_gigachat(data: dict) -> dict:
     """
     Sends the transformed data to GigaChat API and processes the response.
@@ -141,32 +276,108 @@ def send_to_gigachat(data: dict) -> dict:
         The processed response dictionary.
     """
     chat, gpt_model = transform_input_data(data)
-    
-    # Collapse consecutive user role messages into one
-    collapsed_messages = []
-    for message in chat.messages:
-        if collapsed_messages and message.role == "user" and collapsed_messages[-1].role == "user":
-            collapsed_messages[-1].content += "\n" + message.content
-        else:
-            collapsed_messages.append(message)
-    chat.messages = collapsed_messages
-    
     giga_resp = giga.chat(chat)
     result = process_gigachat_response(giga_resp, gpt_model)
     return result
 
-class ProxyHandler(http.server.SimpleHTTPRequestHandler):
+def stream_from_gigachat(data: dict) -> Iterator[dict]:
+    """
+    Sends the transformed data to GigaChat API in streaming mode and processes the response chunks.
+
+    Args:
+        data: The input data dictionary.
+
+    Yields:
+        The processed response chunk dictionaries, as they arrive from GigaChat.
+    """
+    chat, gpt_model = transform_input_data(data)
+    response_id = "chatcmpl-" + os.urandom(16).hex()
+    system_fingerprint = f"fp_{os.urandom(16).hex()}"
+    for giga_chunk in giga.stream(chat):
+        yield process_gigachat_chunk(giga_chunk, gpt_model, response_id, system_fingerprint)
+
+class ProxyHandler(http.server.BaseHTTPRequestHandler):
     """
     Handles HTTP requests and proxies them to the GigaChat API after transforming the data.
     """
     giga = None
     verbose = False
+    # Keep client connections open between requests; every response carries a Content-Length.
+    protocol_version = "HTTP/1.1"
+    # Drop idle keep-alive connections instead of holding their threads forever.
+    timeout = 60
+    # How often an idle keep-alive connection checks whether other connections are waiting for its worker.
+    idle_poll_interval = 0.5
+    # Responses are small and written right after the headers; don't let Nagle hold them back.
+    disable_nagle_algorithm = True
+    # Buffer writes so the status line, headers and body leave in a single send instead of one per write.
+    wbufsize = 64 * 1024
 
     def __init__(self, *args, **kwargs):
         self.giga = self.__class__.giga
         self.verbose = self.__class__.verbose
         super().__init__(*args, **kwargs)
 
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+    def handle(self):
+        self.close_connection = True
+        self.handle_one_request()
+        while not self.close_connection and self._wait_for_next_request():
+            self.handle_one_request()
+
+    def _wait_for_next_request(self) -> bool:
+        """
+        Waits for the client's next request on a kept-alive connection.
+
+        Every idle connection holds a worker, so once other connections are queued for one this
+        connection is closed instead; clients reconnect on their next request. A request the client
+        sends just as the connection is closed is lost and has to be retried, as the OpenAI SDK does.
+
+        Returns:
+            True if the client sent another request, False if the connection should be closed.
+        """
+        # A pipelined request may already be in rfile's buffer, where the selector can't see it.
+        self.connection.settimeout(0)
+        try:
+            if self.rfile.peek(1):
+                return True
+        finally:
+            self.connection.settimeout(self.timeout)
+
+        deadline = time.monotonic() + self.timeout
+        with selectors.DefaultSelector() as selector:
+            selector.register(self.connection, selectors.EVENT_READ)
+            while self.server.requests.empty():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                if selector.select(min(remaining, self.idle_poll_interval)):
+                    return True
+        return False
+
+    def _yield_worker(self) -> bool:
+        """
+        Decides to close a kept-alive connection after this response if other connections are waiting for a worker.
+
+        Returns:
+            True if the response has to carry a Connection: close header.
+        """
+        if self.close_connection or self.server.requests.empty():
+            return False
+        self.close_connection = True
+        return True
+
+    def end_headers(self):
+        if self._yield_worker():
+            self.send_header("Connection", "close")
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        access_logger.info("%s - - [%s] %s", self.address_string(), self.log_date_time_string(), format % args)
+
     def do_GET(self):
         if self.path in ("/models", "/v1/models"):
             self.handle_models_request()
@@ -179,6 +390,7 @@ class ProxyHandler(http.server.SimpleHTTPRequestHandler):
     def do_OPTIONS(self):
         self.send_response(200)
         self.send_header("Allow", "GET, POST, OPTIONS")
+        self.send_header("Content-Length", "0")
         self._send_CORS_headers()
         self.end_headers()
 
@@ -194,97 +406,138 @@ class ProxyHandler(http.server.SimpleHTTPRequestHandler):
         try:
             content_length = int(self.headers.get("Content-Length", 0))
             request_body = self.rfile.read(content_length) if content_length else b''
-            request_body_text = request_body.decode("utf-8", errors="replace")
-            json_body = json.loads(request_body_text)
+            json_body = orjson.loads(request_body)
             stream = json_body.pop("stream", False)
 
             if self.verbose:
-                logging.info(f"Request Headers: {self.headers}")
-                logging.info("Request Body:")
-                logging.info(json.dumps(json_body, ensure_ascii=False, indent=2))
+                logger.info("Request Headers: %s", self.headers)
+                logger.info("Request Body:\n%s", orjson.dumps(json_body, option=orjson.OPT_INDENT_2).decode("utf-8"))
+
+            if stream:
+                self.handle_stream_request(json_body)
+                return
 
             giga_resp = send_to_gigachat(json_body)
-            response_body = json.dumps(giga_resp, ensure_ascii=False, indent=2).encode("utf-8")
+            response_body = orjson.dumps(giga_resp)
 
             if self.verbose:
-                logging.info("Response:")
-                logging.info(json.dumps(giga_resp, ensure_ascii=False, indent=2))
-
-            self.send_response(200)
-            self._send_CORS_headers()
-
-            if stream:
-                self.send_header("Content-Type", "text/event-stream; charset=utf-8")
-                self.send_header("Cache-Control", "no-cache")
-                self.send_header("X-Accel-Buffering", "no")
-                self.end_headers()
-
-                to_send = {
-                    "id": giga_resp["id"],
-                    "object": "chat.completion.chunk",
-                    "created": giga_resp["created"],
-                    "model": giga_resp["model"],
-                    "system_fingerprint": giga_resp.get("system_fingerprint", ""),
-                    "choices": [
-                        {
-                            "index": 0,
-                            "delta": giga_resp["choices"][0]["message"],
-                            "logprobs": None,
-                            "finish_reason": giga_resp["choices"][0]["finish_reason"],
-                        }
-                    ],
-                }
-
-                self.wfile.write(f"data: {json.dumps(to_send, ensure_ascii=False)}\r\n\r\n".encode("utf-8"))
-                self.wfile.write(b"data: [DONE]\r\n\r\n")
-                self.wfile.write(b"\r\n\r\n")
-            else:
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Content-Length', str(len(response_body)))
-                self.send_header('Connection', 'keep-alive')
-                self.send_header("Access-Control-Expose-Headers", "X-Request-ID")
-                self.send_header("OpenAI-Organization", "user-1234567890")
-                self.send_header("OpenAI-Processing-Ms", "100")
-                self.send_header("OpenAI-Version", "2020-10-01")
-                self.send_header("X-RateLimit-Limit-Requests", "10000")
-                self.send_header("X-RateLimit-Limit-Tokens", "50000000")
-                self.send_header("X-RateLimit-Remaining-Requests", "9999")
-                self.send_header("X-RateLimit-Remaining-Tokens", "49999945")
-                self.send_header("X-RateLimit-Reset-Requests", "6ms")
-                self.send_header("X-RateLimit-Reset-Tokens", "0s")
-                self.send_header("X-Request-ID", "req_" + str(uuid.uuid4()))
-                self.end_headers()
-                self.wfile.write(response_body)
+                logger.info("Response:\n%s", orjson.dumps(giga_resp, option=orjson.OPT_INDENT_2).decode("utf-8"))
+
+            self.log_request(200)
+            self.wfile.write(b"".join((
+                JSON_RESPONSE_HEAD,
+                b"%d" % len(response_body),
+                b"\r\nX-Request-ID: req_",
+                os.urandom(16).hex().encode("ascii"),
+                b"\r\nDate: ",
+                self.date_time_string().encode("ascii"),
+                b"\r\nConnection: close\r\n\r\n" if self._yield_worker() else b"\r\n\r\n",
+                response_body,
+            )))
         except Exception as e:
-            logging.error(f"Error processing the request: {e}", exc_info=True)
+            logger.error("Error processing the request: %s", e, exc_info=True)
             self.send_error(500, f"Error processing the request: {e}")
 
-    def handle_models_request(self):
+    def handle_stream_request(self, json_body: dict):
         """
-        Handles requests to /models or /v1/models by returning the models.json content.
+        Streams the GigaChat response to the client as server-sent events, forwarding each chunk as it arrives.
         """
+        chunks = stream_from_gigachat(json_body)
         try:
-            with open("models.json", "r", encoding="utf-8") as f:
-                models_data = json.load(f)
-
-            response_data = json.dumps(models_data, ensure_ascii=False).encode("utf-8")
-
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.send_header("Content-Length", str(len(response_data)))
-            self._send_CORS_headers()
-            self.end_headers()
-            self.wfile.write(response_data)
-        except FileNotFoundError:
+            # Wait for the first chunk before answering, so upstream errors still end up as a 500.
+            # An empty upstream stream is answered with an event stream holding only [DONE].
+            first_chunks = list(itertools.islice(chunks, 1))
+
+            self.log_request(200)
+            # HTTP/1.1 clients get chunked events and can reuse the connection; older ones read until close.
+            chunked = self.request_version >= "HTTP/1.1"
+            if not chunked:
+                self.close_connection = True
+            self.wfile.write(b"".join((
+                EVENT_STREAM_RESPONSE_HEAD,
+                self.date_time_string().encode("ascii"),
+                b"\r\nTransfer-Encoding: chunked" if chunked else b"",
+                b"\r\nConnection: close\r\n\r\n" if self.close_connection or self._yield_worker() else b"\r\n\r\n",
+            )))
+
+            try:
+                for chunk in itertools.chain(first_chunks, chunks):
+                    if self.verbose:
+                        logger.info("Response chunk:\n%s", orjson.dumps(chunk, option=orjson.OPT_INDENT_2).decode("utf-8"))
+                    self._write_event(b"data: " + orjson.dumps(chunk) + b"\r\n\r\n", chunked)
+                    self.wfile.flush()
+            except Exception as e:
+                # The 200 is already on the wire, so the error can only be logged. Closing the connection
+                # without the final chunk tells the client the stream was cut short.
+                logger.error("Error streaming the response: %s", e, exc_info=True)
+                self.close_connection = True
+                return
+
+            self._write_event(b"data: [DONE]\r\n\r\n", chunked)
+            if chunked:
+                self.wfile.write(b"0\r\n\r\n")
+        finally:
+            chunks.close()
+
+    def _write_event(self, event: bytes, chunked: bool):
+        if chunked:
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(event), event))
+        else:
+            self.wfile.write(event)
+
+    def handle_models_request(self):
+        """
+        Handles requests to /models or /v1/models by returning the cached models.json content.
+        """
+        if models_response is None:
             self.send_error(404, "models.json not found")
-        except Exception as e:
-            logging.error(f"Error handling /v1/models request: {e}", exc_info=True)
-            self.send_error(500, "Internal Server Error")
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(models_response)))
+        self._send_CORS_headers()
+        self.end_headers()
+        self.wfile.write(models_response)
 
 class ThreadingHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
-    """This class allows to handle requests in separate threads."""
+    """This class allows to handle requests in a bounded pool of reusable worker threads."""
+    # Workers are daemonic so connections still open at exit don't hold the process up.
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+    # Idle keep-alive connections hold a worker too, but give it up as soon as others are queued for it.
+    max_workers = min(256, (os.cpu_count() or 1) * 32)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requests = queue.Queue()
+        for i in range(self.max_workers):
+            threading.Thread(target=self._serve_requests, name=f"gpt2giga_{i}", daemon=self.daemon_threads).start()
+
+    def _serve_requests(self):
+        # None is queued by server_close to stop the worker.
+        for item in iter(self.requests.get, None):
+            self.process_request_thread(*item)
+
+    def process_request(self, request, client_address):
+        self.requests.put((request, client_address))
+
+    def server_close(self):
+        super().server_close()
+        for _ in range(self.max_workers):
+            self.requests.put(None)
 
-def run_proxy_server(host: str, port: int, verbose: bool):
+def warm_up_gigachat_client():
+    """
+    Authenticates and opens a connection to GigaChat ahead of the first proxied request.
+    """
+    try:
+        giga.get_models()
+    except Exception as e:
+        logger.warning("GigaChat client warm-up failed: %s", e)
+
+def run_proxy_server(host: str, port: int, verbose: bool, max_workers: Optional[int] = None):
     """
     Runs the proxy server.
 
@@ -292,17 +545,43 @@ def run_proxy_server(host: str, port: int, verbose: bool):
         host: The host to listen on.
         port: The port to listen on.
         verbose: Enables verbose logging if True.
+        max_workers: The maximum number of client connections served concurrently; defaults to the server's own limit.
     """
     server_address = (host, port)
     ProxyHandler.verbose = verbose
     ProxyHandler.giga = giga
+    if max_workers is not None:
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        ThreadingHTTPServer.max_workers = max_workers
 
     logging_level = logging.INFO if verbose else logging.WARNING
-    logging.basicConfig(level=logging_level)
+    # Handler threads only format and enqueue log records; a single listener thread writes them out.
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(level=logging_level, handlers=[QueueHandler(log_queue)])
+    # Access lines were always printed, verbose or not.
+    access_logger.setLevel(logging.INFO)
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+
+    threading.Thread(target=warm_up_gigachat_client, daemon=True).start()
 
     httpd = ThreadingHTTPServer(server_address, ProxyHandler)
     print(f"Serving HTTP proxy on {host} port {port}...")
-    httpd.serve_forever()
+    try:
+        httpd.serve_forever()
+    finally:
+        httpd.server_close()
+        listener.stop()
+
+def positive_int(value: str) -> int:
+    """
+    Parses a command line value that has to be a positive integer.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
 
 def main():
     parser = argparse.ArgumentParser(
@@ -326,9 +605,19 @@ def main():
         default=os.getenv("GPT2GIGA_VERBOSE", "False") != "False",
         help="enable verbose logging"
     )
+    parser.add_argument(
+        "--max-workers",
+        type=positive_int,
+        default=os.getenv("GPT2GIGA_MAX_WORKERS"),
+        help=(
+            "Maximum number of client connections served concurrently (default: 32 per CPU, at most 256). "
+            "Idle keep-alive connections count towards it until other connections are waiting, "
+            "then they are closed and their clients reconnect"
+        ),
+    )
 
     args = parser.parse_args()
-    run_proxy_server(args.host, args.port, args.verbose)
+    run_proxy_server(args.host, args.port, args.verbose, args.max_workers)
 
 if __name__ == "__main__":
     main()